@@ -1,6 +1,15 @@
 #Uses python3
 
+import os
 import sys
+import heapq
+import numpy as np
+
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints, write_ints
 
 
 # Naive Algorithm: Loop in n (number of advertisments), and in each iteration,
@@ -18,6 +27,25 @@ import sys
 # Time Complexity of merge sort: O(nlogn)
 # OVERALL TIME COMPLEXITY OF OPTIMIZED ALGORITHM: O(nlogn)
 
+# Bottom-up Merge Sort: the recursive merge sort slices copies of the array at every level and grows the merged array
+#                       one single-element list at a time, producing O(nlogn) temporary lists for the garbage collector.
+#                       Instead, we start with runs of length 1 and merge each pair of neighbouring runs into runs of double
+#                       the length, level by level, without recursion. Only two buffers (lists) of size n are used:
+#                       each level merges the runs from the source buffer into the destination buffer,
+#                       then both buffers swap roles (ping-pong), so nothing is copied back.
+# Time Complexity: O(nlogn), Space Complexity: O(n)
+# max_dot_product can also delegate the sorting to Python's sorted or to np.sort
+
+# Vectorized and Top-k Variants: max_dot_product_numpy sorts with np.sort and sums the products with np.dot,
+#                                using int64 only when n x max|a| x max|b| cannot overflow it, and Python integers (object arrays) otherwise.
+#                                When only k of the slots are to be filled, and profits and clicks are non-negative, the best choice
+#                                is the k largest values of both arrays matched in sorted order, so the whole arrays do not need sorting:
+#                                the k largest values are found with np.partition in O(n) and only they are sorted in O(klogk).
+#                                (With negative values, the k largest are not always the best choice, so the top-k variant rejects them)
+# Time Complexity of top-k variant: O(n + klogk)
+# Streaming Variant: StreamingMaxDotProduct keeps the k largest values of each array seen so far in min heaps of size k,
+#                    so each arriving ad or slot costs O(logk), and the maximum revenue of k slots is found from the heaps in O(klogk)
+
 
 # Merging the smaller subarray elements and sorting them ascendingly,
 # while working our way up after breaking down the array
@@ -63,23 +91,163 @@ def merge_sort(array):
 
     return merged_sorted_array
 
-def max_dot_product(a, b):
+# Merging the two neighbouring sorted runs source[left:middle] and source[middle:right] into destination[left:right]
+def merge_runs(source, destination, left, middle, right):
+
+    first_run_pointer = left
+    second_run_pointer = middle
+    destination_pointer = left
+
+    # Same as merge, but writing in place in the destination buffer instead of growing a new list
+    while first_run_pointer < middle and second_run_pointer < right:
+
+        if source[first_run_pointer] <= source[second_run_pointer]:
+            destination[destination_pointer] = source[first_run_pointer]
+            first_run_pointer += 1
+        else:
+            destination[destination_pointer] = source[second_run_pointer]
+            second_run_pointer += 1
+        destination_pointer += 1
+
+    # The rest of the non-empty run is copied at once
+    if first_run_pointer < middle:
+        destination[destination_pointer:right] = source[first_run_pointer:middle]
+    else:
+        destination[destination_pointer:right] = source[second_run_pointer:right]
+
+
+def merge_sort_bottom_up(values):
+
+    # Plain lists: indexing array('q') buffers boxes every element into a new int, which makes them slower
+    source = list(values)
+    destination = [0] * len(source)
+
+    n = len(source)
+    width = 1
+    # Merging neighbouring runs of length width into runs of length 2 x width, until one run covers the whole array
+    while width < n:
+        for left in range(0, n, 2 * width):
+            middle = min(left + width, n)
+            right = min(left + 2 * width, n)
+            merge_runs(source, destination, left, middle, right)
+        # Ping-pong: the merged runs become the source of the next level
+        source, destination = destination, source
+        width *= 2
+
+    return source
+
+
+def sort_ascending(values, method='bottom_up'):
+
+    if method == 'bottom_up':
+        return merge_sort_bottom_up(values)
+    if method == 'recursive':
+        return merge_sort(values) if len(values) > 0 else []
+    if method == 'builtin':
+        return sorted(values)
+    if method == 'numpy':
+        return np.sort(np.asarray(values))
+    raise ValueError("Unknown sorting method: {}".format(method))
+
+
+def max_dot_product(a, b, method='bottom_up'):
 
     # Sort arrays of avg clicks of slots and profit per each click on ads
     # so as to always multiply the greatest profit per click on ad with the greatest avg number of clicks on slot
     # and get the maximum advertisement revenue
-    sorted_a = merge_sort(a)
-    sorted_b = merge_sort(b)
+    # Typed buffers (array module or NumPy) are turned into lists of Python numbers, which keep fractions and never overflow
+    sorted_a = sort_ascending(a, method)
+    sorted_b = sort_ascending(b, method)
+    if not isinstance(sorted_a, list):
+        sorted_a = sorted_a.tolist()
+    if not isinstance(sorted_b, list):
+        sorted_b = sorted_b.tolist()
     res = 0
     for i in range(len(a)):
         res += sorted_a[i] * sorted_b[i]
     return res
 
+# Choosing int64 when sums of count products of values in a and b cannot overflow it, and Python integers otherwise
+def get_safe_dtype(a, b, count):
+
+    if a.dtype.kind not in 'iub' or b.dtype.kind not in 'iub':
+        return np.result_type(a, b)
+    if len(a) == 0 or len(b) == 0:
+        return np.int64
+    largest_product = max(abs(int(a.min())), abs(int(a.max()))) * max(abs(int(b.min())), abs(int(b.max())))
+    if largest_product * count <= np.iinfo(np.int64).max:
+        return np.int64
+    return object
+
+
+# np.dot returns NumPy scalars for int64 and float arrays, and Python integers for object arrays
+def as_python_number(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def max_dot_product_numpy(a, b, k=None):
+
+    a = np.asarray(a)
+    b = np.asarray(b)
+    n = min(len(a), len(b))
+    if k is None or k >= n:
+        k = n
+    if k == 0:
+        return 0
+
+    dtype = get_safe_dtype(a, b, k)
+    a = a.astype(dtype)
+    b = b.astype(dtype)
+
+    # Filling all the slots: both arrays are sorted and matched as in max_dot_product
+    if k == len(a) == len(b):
+        return as_python_number(np.dot(np.sort(a), np.sort(b)))
+
+    # Filling k slots: only the k largest values of each array are partitioned out, sorted and matched
+    if a.min() < 0 or b.min() < 0:
+        raise ValueError("Top-k revenue requires non-negative profits and clicks")
+    largest_a = np.sort(np.partition(a, len(a) - k)[len(a) - k:])
+    largest_b = np.sort(np.partition(b, len(b) - k)[len(b) - k:])
+
+    return as_python_number(np.dot(largest_a, largest_b))
+
+
+class StreamingMaxDotProduct:
+
+    def __init__(self, k):
+        # Number of slots to be filled, and min heaps of the k largest profits per click on ads
+        # and the k largest average clicks of slots seen so far
+        self.k = k
+        self.largest_profits = []
+        self.largest_clicks = []
+
+    # Keeping value in a min heap of the k largest values if it is among them, in O(logk)
+    def push_bounded(self, heap, value):
+        if value < 0:
+            raise ValueError("Top-k revenue requires non-negative profits and clicks")
+        if len(heap) < self.k:
+            heapq.heappush(heap, value)
+        elif heap and value > heap[0]:
+            heapq.heapreplace(heap, value)
+
+    def add_ad(self, profit):
+        self.push_bounded(self.largest_profits, profit)
+
+    def add_slot(self, clicks):
+        self.push_bounded(self.largest_clicks, clicks)
+
+    # Maximum revenue of filling k slots (or as many as there are ads and slots) with the ads and slots seen so far, in O(klogk)
+    def revenue(self):
+        k = min(len(self.largest_profits), len(self.largest_clicks))
+        largest_a = sorted(self.largest_profits)[-k:] if k > 0 else []
+        largest_b = sorted(self.largest_clicks)[-k:] if k > 0 else []
+        return sum(profit * clicks for profit, clicks in zip(largest_a, largest_b))
+
+
 if __name__ == '__main__':
-    input = sys.stdin.read()
-    data = list(map(int, input.split()))
+    data = read_ints().tolist()
     n = data[0]
     a = data[1:(n + 1)]
     b = data[(n + 1):]
-    print(max_dot_product(a, b))
+    write_ints([max_dot_product(a, b)])
     
@@ -1,5 +1,14 @@
 # Uses python3
+import os
 import sys
+import numpy as np
+
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints, write_ints
+from pisano_period import get_pisano_period
 
 # Time Complexity of naive: O(n), with n up to 10^18
 # Optimized Algorithm: According to Pisano table, F(n) % m = F(n % Pisano period) % m,
@@ -9,35 +18,142 @@ import sys
 # Practically at maximum m identified, it is way less than that, as we break when the period is found,
 # And the pisano period of m^3 = 1500, with stepping by 2, making the result 750 iterations
 
+# Fast Doubling Algorithm: The Pisano approach depends on m, so it becomes impractical for large moduli (m up to 10^18),
+#                          while n can be handled independently of m using the identities:
+#                          F(2k) = F(k) x (2F(k+1) - F(k))   and   F(2k+1) = F(k)^2 + F(k+1)^2
+#                          Walking over the bits of n from the most significant one, the pair (F(k), F(k+1)) is doubled
+#                          at each bit, and advanced by one more step if the bit is set, reducing modulo m at every step
+#                          so the numbers never grow beyond m^2
+# TIME COMPLEXITY: O(log(n)) multiplications of numbers smaller than m, independent of m
+# The Pisano period is at most 6m, so finding it is only worth it when m is tiny compared to the number of bits of n,
+# get_fibonacci_huge_fast picks between both methods accordingly
+# The Pisano period itself is computed from the factorization of m and cached in pisano_period, so repeated moduli do not
+# pay for finding it again
+
+# Batched queries: answering millions of (n, m) queries one by one pays the Python overhead of every fast doubling step
+# for every query. fibonacci_huge_batch groups the queries by modulus, so the period of each modulus is found once,
+# reduces every n modulo this period, and then runs fast doubling over all the n's of the group at once with NumPy,
+# selecting per element whether to advance by one more step according to its own bit.
+# Moduli above 2^31 cannot be vectorized, as the squares added in F(2k+1) would overflow int64, so they are answered one by one.
+# TIME COMPLEXITY: O(q x log(m)) arithmetic steps for q queries, but only O(log(m)) NumPy operations per distinct modulus
+
+
+# Upper bound of the Pisano period relative to m, used to estimate the cost of finding it
+PISANO_PERIOD_BOUND = 6
+
+# Largest modulus whose fast doubling steps fit in int64, as F(k)^2 + F(k+1)^2 < 2m^2 <= 2^63
+VECTORIZED_MODULUS_BOUND = 2 ** 31
 
-def get_fibonacci_huge_fast(n,m):
-
-    # Calculating Pisano period
-    pisano_period = 0
-    # Only the Pisano period of 2 is odd, does not apply to general characteristics
-    if m == 2:
-        pisano_period = 3
-    else:
-        current = 0
-        next = 1
-        # Stepping by 2 as Pisano period is even, and going up to m x m until period is found
-        for i in range(2, m*m, 2):
-            current = (current + next) % m
-            next = (current + next) % m
-            if current == 0 and next == 1:
-                pisano_period = i
-                break
+
+def get_fibonacci_huge_pisano(n, m):
 
     # Applying the rule: F(n) % m = F(n % Pisano period) % m
-    remainder = n % pisano_period
+    remainder = n % get_pisano_period(m)
     current = 0
     next = 1
-    # Finding F(n % Pisano period)
+    # Finding F(n % Pisano period), reducing at every step so the numbers stay below m
     for i in range(remainder):
-        current, next = next, current + next
-    
+        current, next = next, (current + next) % m
+
     return current % m
 
+
+def get_fibonacci_huge_doubling(n, m):
+
+    # (current, next) holds (F(k), F(k+1)) modulo m, starting with k = 0
+    current = 0
+    next = 1 % m
+
+    # Walking over the bits of n from the most significant one, k becomes 2k or 2k+1 at each bit
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) x (2F(k+1) - F(k))
+        double = current * ((2 * next - current) % m) % m
+        # F(2k+1) = F(k)^2 + F(k+1)^2
+        double_next = (current * current + next * next) % m
+        if bit == '1':
+            current, next = double_next, (double + double_next) % m
+        else:
+            current, next = double, double_next
+
+    return current
+
+
+def get_fibonacci_huge_fast(n, m, method=None):
+
+    # Picking the method automatically if not specified: the Pisano period costs up to 6m steps to find,
+    # while fast doubling costs one step per bit of n
+    if method is None:
+        method = 'pisano' if PISANO_PERIOD_BOUND * m <= n.bit_length() else 'doubling'
+
+    if method == 'pisano':
+        return get_fibonacci_huge_pisano(n, m)
+    if method == 'doubling':
+        return get_fibonacci_huge_doubling(n, m)
+    raise ValueError("Unknown method: {}".format(method))
+
+
+# Fast doubling over an int64 array of n's sharing the same modulus m <= VECTORIZED_MODULUS_BOUND
+def get_fibonacci_huge_doubling_vectorized(ns, m):
+
+    current = np.zeros(len(ns), dtype=np.int64)
+    next = np.full(len(ns), 1 % m, dtype=np.int64)
+    if len(ns) == 0:
+        return current
+
+    # Walking over the bits of all n's together from the most significant bit of the largest one,
+    # leading zero bits of smaller n's keep them at (F(0), F(1)), as doubling k = 0 gives k = 0 again
+    for b in range(int(ns.max()).bit_length() - 1, -1, -1):
+        double = current * ((2 * next - current) % m) % m
+        double_next = (current * current + next * next) % m
+        bit = ((ns >> b) & 1).astype(bool)
+        current = np.where(bit, double_next, double)
+        next = np.where(bit, (double + double_next) % m, double_next)
+
+    return current
+
+
+def fibonacci_huge_batch(ns, ms):
+
+    # A single modulus can be given for all the queries
+    ns = np.asarray(ns)
+    ms = np.broadcast_to(np.asarray(ms), ns.shape).ravel()
+    ns = ns.ravel()
+
+    # Results fit in int64 unless some modulus is beyond it
+    fits_int64 = len(ms) == 0 or int(ms.max()) <= np.iinfo(np.int64).max
+    results = np.zeros(len(ns), dtype=np.int64 if fits_int64 else object)
+
+    # Grouping the queries by modulus: sorting the indices of the queries by their modulus,
+    # so each group is a contiguous slice of the sorted indices
+    moduli, inverse = np.unique(ms, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    boundaries = np.searchsorted(inverse[order], np.arange(len(moduli) + 1))
+
+    for g in range(len(moduli)):
+        m = int(moduli[g])
+        indices = order[boundaries[g]:boundaries[g + 1]]
+        group = ns[indices]
+
+        # Applying the rule: F(n) % m = F(n % Pisano period) % m once for the whole group
+        period = get_pisano_period(m)
+        if m <= VECTORIZED_MODULUS_BOUND:
+            reduced = (group % period).astype(np.int64)
+            results[indices] = get_fibonacci_huge_doubling_vectorized(reduced, m)
+        else:
+            results[indices] = [get_fibonacci_huge_doubling(int(n) % period, m) for n in group]
+
+    return results
+
+
+# Answering one "n m" query per line as soon as it is read, so many queries are answered by the same process
+def stream_fibonacci_huge(input_stream, output_stream):
+
+    for line in input_stream:
+        if line.strip():
+            n, m = map(int, line.split())
+            output_stream.write(str(get_fibonacci_huge_fast(n, m)) + '\n')
+            output_stream.flush()
+
 def get_fibonacci_huge_naive(n, m):
 
     if n <= 1:
@@ -52,7 +168,10 @@ def get_fibonacci_huge_naive(n, m):
     return current % m
 
 if __name__ == '__main__':
-    input = sys.stdin.read();
-    n, m = map(int, input.split())
-    print(get_fibonacci_huge_fast(n, m))
-    
\ No newline at end of file
+    # Streaming mode: python3 fibonacci_huge.py --stream, then one "n m" query per line
+    if '--stream' in sys.argv[1:]:
+        stream_fibonacci_huge(sys.stdin, sys.stdout)
+        sys.exit()
+
+    n, m = read_ints().tolist()
+    write_ints([get_fibonacci_huge_fast(n, m)])
@@ -0,0 +1,228 @@
+# Uses python3
+import os
+import sys
+import math
+import random
+from functools import lru_cache
+
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints, write_ints
+
+
+# Finding the Pisano period by stepping through the Fibonacci sequence modulo m (as in fibonacci_huge) costs up to 6m steps,
+# which is paid again on every call even when the same moduli are used over and over.
+# Instead, the period is built from the factorization of m using the following known properties:
+# 1) If m = p1^k1 x p2^k2 x ... x pr^kr, then Pisano(m) = lcm( Pisano(p1^k1), Pisano(p2^k2), ..., Pisano(pr^kr) ),
+#    since the sequence repeats modulo m exactly when it repeats modulo every prime power dividing it
+# 2) For a prime p other than 2 and 5: if p = ±1 (mod 5), then p divides F(p-1) and Pisano(p) divides p-1,
+#                                       if p = ±2 (mod 5), then p divides F(p+1) and Pisano(p) divides 2(p+1)
+#    Pisano(2) = 3 and Pisano(5) = 20
+# 3) Pisano(p^k) divides p^(k-1) x Pisano(p)
+# So for every prime power q = p^k there is a known multiple of its period. The exact period is the order of the Fibonacci matrix
+# modulo q, which is found by dividing this multiple by each of its prime factors as long as the sequence still repeats
+# (F(d) = 0 and F(d+1) = 1 modulo q), checked with fast doubling in O(log(d)).
+# Factorization is done by trial division for small factors, then Pollard's rho (Brent's variant) with a deterministic
+# Miller-Rabin primality test for numbers up to 3.3 x 10^24, which covers m up to 10^18.
+# COMPLEXITY: O(m^(1/4)) expected for the factorization, plus O(log^2(m)) fast doubling steps per prime power
+# Results are kept in a bounded LRU cache (functools.lru_cache is thread-safe and keeps hit and miss counters),
+# so repeated moduli cost O(1).
+
+
+# Maximum number of moduli whose periods are kept in the cache
+PISANO_CACHE_SIZE = 1024
+
+# Factors below this bound are found by trial division before falling back to Pollard's rho
+TRIAL_DIVISION_BOUND = 1000
+
+# Witnesses making Miller-Rabin deterministic for all numbers below 3.3 x 10^24
+MILLER_RABIN_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def is_prime(n):
+
+    if n < 2:
+        return False
+    for p in MILLER_RABIN_WITNESSES:
+        if n % p == 0:
+            return n == p
+
+    # Writing n - 1 as d x 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    # n is composite if any witness proves it, otherwise it is prime
+    for a in MILLER_RABIN_WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+# Finding a non-trivial factor of composite n using Pollard's rho with Brent's cycle detection
+def pollard_rho(n):
+
+    if n % 2 == 0:
+        return 2
+
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        batch = 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved_y = y
+                # Multiplying the differences together to take one gcd per batch instead of one per step
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+
+        # If the batch overshot the factor, step back one at a time from the start of the batch
+        if g == n:
+            g = 1
+            while g == 1:
+                saved_y = (saved_y * saved_y + c) % n
+                g = math.gcd(abs(x - saved_y), n)
+
+        if g != n:
+            return g
+
+
+# Factorizing n into a dictionary of prime: exponent
+def factorize(n):
+
+    factors = {}
+
+    # Removing small factors by trial division
+    for p in range(2, TRIAL_DIVISION_BOUND):
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+
+    # Splitting the rest with Pollard's rho until only primes are left
+    remaining = [n] if n > 1 else []
+    while remaining:
+        n = remaining.pop()
+        if is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        else:
+            d = pollard_rho(n)
+            remaining += [d, n // d]
+
+    return factors
+
+
+# Finding (F(n) % m, F(n+1) % m) using fast doubling, as explained in fibonacci_huge
+def get_fibonacci_pair(n, m):
+
+    current = 0
+    next = 1 % m
+    for bit in bin(n)[2:]:
+        double = current * ((2 * next - current) % m) % m
+        double_next = (current * current + next * next) % m
+        if bit == '1':
+            current, next = double_next, (double + double_next) % m
+        else:
+            current, next = double, double_next
+
+    return current, next
+
+
+# Finding a multiple of Pisano(p) for prime p, as stated in property 2 above,
+# returned as a dictionary of prime: exponent to be reduced later
+def get_prime_period_bound(p):
+
+    if p == 2:
+        return {3: 1}
+    if p == 5:
+        return {2: 2, 5: 1}
+    if p % 5 in (1, 4):
+        return factorize(p - 1)
+
+    bound = factorize(p + 1)
+    bound[2] = bound.get(2, 0) + 1
+    return bound
+
+
+def get_prime_power_period(p, k):
+
+    q = p ** k
+
+    # Pisano(p^k) divides p^(k-1) x (bound of Pisano(p)), so we start from this multiple
+    bound = get_prime_period_bound(p)
+    if k > 1:
+        bound[p] = bound.get(p, 0) + k - 1
+
+    period = 1
+    for prime, exponent in bound.items():
+        period *= prime ** exponent
+
+    # Dividing the multiple by each of its prime factors as long as the sequence still repeats after the smaller length
+    for prime, exponent in bound.items():
+        for _ in range(exponent):
+            if get_fibonacci_pair(period // prime, q) != (0, 1):
+                break
+            period //= prime
+
+    return period
+
+
+@lru_cache(maxsize=PISANO_CACHE_SIZE)
+def get_pisano_period(m):
+
+    # Combining the periods of all prime powers dividing m using the lcm, as stated in property 1 above
+    period = 1
+    for p, k in factorize(m).items():
+        prime_power_period = get_prime_power_period(p, k)
+        period = period * prime_power_period // math.gcd(period, prime_power_period)
+
+    return period
+
+
+# Statistics of the cache: hits, misses, maximum size and current size
+def get_pisano_cache_info():
+    return get_pisano_period.cache_info()
+
+
+def clear_pisano_cache():
+    get_pisano_period.cache_clear()
+
+
+# Finding the Pisano period by stepping through the sequence until 0, 1 appears again, for stress testing
+def get_pisano_period_naive(m):
+
+    if m == 1:
+        return 1
+
+    current = 0
+    next = 1
+    for i in range(1, 6*m + 1):
+        current, next = next, (current + next) % m
+        if current == 0 and next == 1:
+            return i
+
+
+if __name__ == '__main__':
+    m, = read_ints().tolist()
+    write_ints([get_pisano_period(m)])
@@ -1,5 +1,18 @@
 # Uses python3
+import os
+import sys
+import json
+import time
+import platform
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints
 
 
 
@@ -19,113 +32,213 @@ import numpy as np
 # RECURRANCE EQUATION: 8xT(n/2) + Kxn^2
 # TIME COMPLEXITY: Θ(n^3)
 
-def wrapped_matrix_mult(A, B, n, ai, aj, bi, bj):
+# Block-recursive engine: instead of allocating a new n x n product at every recursion step (even for 1x1) and copying the
+# 8 sub-products back element by element with Python loops, the product matrix is allocated once by the first call,
+# and every recursive call receives a view (slice) of the quadrant of the product it contributes to, adding its result into it in place.
+# So AE and BG are both added into the upper left quadrant of the product, AF and BH into the upper right one, and so on,
+# and no copying or combination of sub-matrices is needed at all.
+# Recursing down to 1x1 pays a Python call per scalar multiplication, so below a tunable cutoff size, the block is multiplied
+# directly with np.dot (BLAS), which is the same divide and conquer carried on by the library on blocks fitting the cache.
+# With cutoff = 1, the recursion is the same as the original one, down to 1x1 sub-problems.
+
+
+# Exact Arithmetic Modes:
+# The input matrices are integers, but accumulating into float64 loses precision beyond 2^53 and prints floats.
+# So the product can be computed in one of the following modes, selected by the mode parameter:
+# 'float': float64, as originally
+# 'int64': exact int64, provided no intermediate value can overflow. Since NumPy integers wrap around silently, this is checked
+#          before multiplying with a bound on the largest intermediate value: max|A| x max|B| x k for the naive algorithm, and for
+#          Strassen, as each level adds up to 2 operands on each side and up to 4 products, a factor of 8 more per level.
+#          OverflowError is raised if the bound exceeds int64
+# 'object': arbitrary-precision Python integers in NumPy object arrays, exact for any values but much slower
+# 'exact': 'int64' if no overflow is possible, 'object' otherwise
+# 'mod': every result is reduced modulo a prime (or any modulus) p, which allows Strassen to be used for exact counting
+#        problems, such as powers of matrices of linear recurrences modulo p (matrix_power_mod).
+#        Operands of every Strassen product are reduced right after they are formed, and each block of the product right after
+#        its sub-products are accumulated, so values stay within a few multiples of p.
+#        Block products use BLAS where possible, through dot_mod: float64 holds integers exactly up to 2^53, so if
+#        k x (p-1)^2 < 2^53, one float np.dot gives the exact product before reduction. Otherwise, for p < 2^31, each matrix is
+#        split into high and low halves of s bits (X = Xh x 2^s + Xl), and the product is assembled from the 4 float products of the
+#        halves, computed over chunks of the inner dimension small enough to stay exact: X x Y = Xh Yh 2^(2s) + (Xh Yl + Xl Yh) 2^s + Xl Yl.
+#        Larger moduli fall back to object arrays.
+
+
+# Size at or below which blocks are multiplied with np.dot instead of being divided further
+MATRIX_MULT_CUTOFF = 64
+
+# Largest integer below which float64 represents all integers exactly, and largest modulus handled with int64 and float splitting
+FLOAT_EXACT_LIMIT = 2 ** 53
+INT64_MODULUS_LIMIT = 2 ** 31
+
+
+# Reducing array modulo modulus in place, if a modulus is given
+def reduce_mod(array, modulus):
+    if modulus is not None:
+        np.remainder(array, modulus, out=array)
+
+
+# Exact product of X and Y modulo p, for integer matrices with entries in [0, p)
+def dot_mod(X, Y, p):
+
+    k = X.shape[1]
+    if p >= INT64_MODULUS_LIMIT:
+        return np.dot(X.astype(object), Y.astype(object)) % p
+
+    # A single float product is exact when no sum can exceed 2^53
+    if k * (p - 1) ** 2 < FLOAT_EXACT_LIMIT:
+        return np.dot(X.astype(np.float64), Y.astype(np.float64)).astype(np.int64) % p
+
+    # Splitting entries into s-bit halves, and the inner dimension into chunks whose float products of halves stay exact
+    X = X.astype(np.int64)
+    Y = Y.astype(np.int64)
+    s = ((p - 1).bit_length() + 1) // 2
+    mask = (1 << s) - 1
+    Xh, Xl = (X >> s).astype(np.float64), (X & mask).astype(np.float64)
+    Yh, Yl = (Y >> s).astype(np.float64), (Y & mask).astype(np.float64)
+    chunk = max(1, (FLOAT_EXACT_LIMIT - 1) // (mask * mask))
+    high_factor = pow(2, 2 * s, p)
+    middle_factor = pow(2, s, p)
+
+    result = np.zeros((X.shape[0], Y.shape[1]), dtype=np.int64)
+    for start in range(0, k, chunk):
+        end = min(start + chunk, k)
+        high = np.dot(Xh[:, start:end], Yh[start:end]).astype(np.int64) % p
+        middle = (np.dot(Xh[:, start:end], Yl[start:end]).astype(np.int64) % p
+                  + np.dot(Xl[:, start:end], Yh[start:end]).astype(np.int64) % p)
+        low = np.dot(Xl[:, start:end], Yl[start:end]).astype(np.int64) % p
+        # Each term is below p^2 < 2^62 before reduction
+        result += high * high_factor % p
+        result += middle % p * middle_factor % p
+        result += low
+        result %= p
+
+    return result
+
+
+# Product of blocks X and Y, exact modulo modulus if one is given
+def block_dot(X, Y, modulus=None):
+    if modulus is None:
+        return np.dot(X, Y)
+    return dot_mod(X, Y, modulus)
+
+
+# Converting A and B for the given mode, returning them with the dtype of the product and the modulus (None if not in 'mod' mode)
+# levels is the number of Strassen levels (0 for the naive algorithm), used to bound the intermediate values in 'int64' mode
+def prepare_operands(A, B, mode, modulus, levels):
+
+    if mode == 'float':
+        return A, B, np.float64, None
+
+    if mode == 'mod':
+        if modulus is None or modulus < 2:
+            raise ValueError("Mode 'mod' needs a modulus of at least 2")
+        dtype = np.int64 if modulus < INT64_MODULUS_LIMIT else object
+        return np.asarray(A, dtype=dtype) % modulus, np.asarray(B, dtype=dtype) % modulus, dtype, modulus
+
+    if mode == 'object':
+        return np.asarray(A, dtype=object), np.asarray(B, dtype=object), object, None
+
+    if mode in ('int64', 'exact'):
+        largest_a = max(abs(int(A.min())), abs(int(A.max()))) if A.size else 0
+        largest_b = max(abs(int(B.min())), abs(int(B.max()))) if B.size else 0
+        bound = largest_a * largest_b * max(A.shape[1], 1) * 8 ** levels
+        if bound <= np.iinfo(np.int64).max:
+            return np.asarray(A, dtype=np.int64), np.asarray(B, dtype=np.int64), np.int64, None
+        if mode == 'int64':
+            raise OverflowError("Product may overflow int64, use mode 'exact' or 'object'")
+        return np.asarray(A, dtype=object), np.asarray(B, dtype=object), object, None
+
+    raise ValueError("Unknown mode: {}".format(mode))
+
+
+# Number of Strassen levels applied to sizes m, k, n before reaching the cutoff
+def count_levels(m, k, n, cutoff):
+
+    levels = 0
+    size = min(m, k, n)
+    while size > cutoff:
+        size //= 2
+        levels += 1
+    return levels
+
+
+def wrapped_matrix_mult(A, B, ai, aj, bi, bj, shape, product=None, cutoff=None, modulus=None):
+
+    if cutoff is None:
+        cutoff = MATRIX_MULT_CUTOFF
+    # The tuned cutoff is measured for Strassen's algorithm only (see get_strassen_cutoff)
+    elif cutoff == 'auto':
+        raise ValueError("cutoff='auto' is only supported by matrix_mult_fast, pass a size instead")
+    # Sizes of the blocks multiplied at this step: rows of the A block, columns of the A block (= rows of the B block),
+    # and columns of the B block
+    rows, inner, columns = shape
+
+    # Initializing product array to be filled with zeros, only in the first call
+    if product is None:
+        product = np.zeros((rows, columns))
+
+    # Base case of recursion: adding the product of the blocks at the pointers of A and B,
+    # reaching 1x1 blocks if cutoff = 1
+    if min(rows, inner, columns) <= cutoff:
+        product += block_dot(A[ai:ai + rows, aj:aj + inner], B[bi:bi + inner, bj:bj + columns], modulus)
+        reduce_mod(product, modulus)
+        return product
 
-    # Initializing product array to be filled with zeros
-    product = np.zeros((n,n))
+    # Each size is split into 2 halves, the second one larger by 1 if the size is odd
+    r = rows//2
+    k = inner//2
+    c = columns//2
+    top, bottom = r, rows - r
+    first, second = k, inner - k
+    left, right = c, columns - c
 
-    # Base case of recursion: returning 1x1 matrix according to pointer values at this recursion step
-    if n == 1:
-        product[0,0] = A[ai, aj] * B[bi, bj]
-        return product
+    # Views of the 4 quadrants of the product, each receiving the sum of 2 of the 8 sub-problems
+    upper_left = product[:r, :c]
+    upper_right = product[:r, c:]
+    lower_left = product[r:, :c]
+    lower_right = product[r:, c:]
 
     # Division into 8 sub-problems/sub-matrices recursively
-    # Each is computed according to A pointers and B pointers, indicating the sub-matrices to be multiplied in both A and B
-
-    AE = wrapped_matrix_mult(A, B, n//2, ai, aj, bi, bj)
-    BG = wrapped_matrix_mult(A, B, n//2, ai, aj + n//2, bi + n//2, bj)
-
-    AF = wrapped_matrix_mult(A, B, n//2, ai, aj, bi, bj + n//2)
-    BH = wrapped_matrix_mult(A, B, n//2, ai, aj + n//2, bi + n//2, bj + n//2)
-
-    CE = wrapped_matrix_mult(A, B, n//2, ai + n//2, aj, bi, bj)
-    DG = wrapped_matrix_mult(A, B, n//2, ai + n//2, aj + n//2, bi + n//2, bj)
-
-    CF = wrapped_matrix_mult(A, B, n//2, ai + n//2, aj, bi, bj + n//2)
-    DH = wrapped_matrix_mult(A, B, n//2, ai + n//2, aj + n//2, bi + n//2, bj + n//2)
-
-    # Placement of all 8 sub-matrices in their right places in the product matrix,
-    # with the guide of pi --> product's row pointer, pj --> product's column pointer
-    # by addition of the right 2 sub-matrices in their right places
-
-    # Upper left sub-matrix placement: AE + BG
-    pi = 0
-    for i in range(n//2):
-        pj = 0
-        for j in range(n//2):
-            product[pi, pj] += AE[i, j] + BG[i, j]
-            pj += 1
-        pi += 1
-
-    # Upper right sub-matrix placement: AF + BH
-    pi = 0
-    for i in range(n//2):
-        pj = n//2
-        for j in range(n//2):
-            product[pi, pj] += AF[i, j] + BH[i, j]
-            pj += 1
-        pi += 1
-
-    # Lower left sub-matrix placement: CE + DG
-    pi = n//2
-    for i in range(n//2):
-        pj = 0
-        for j in range(n//2):
-            product[pi, pj] += CE[i, j] + DG[i, j]
-            pj += 1
-        pi += 1
-
-    # Lower right sub-matrix placement: CF + DH
-    pi = n//2
-    for i in range(n//2):
-        pj = n//2
-        for j in range(n//2):
-            product[pi, pj] += CF[i, j] + DH[i, j]
-            pj += 1
-        pi += 1
+    # Each is computed according to A pointers and B pointers, indicating the sub-matrices to be multiplied in both A and B,
+    # and added in place into its quadrant of the product
+
+    # Upper left sub-matrix: AE + BG
+    wrapped_matrix_mult(A, B, ai, aj, bi, bj, (top, first, left), upper_left, cutoff, modulus)
+    wrapped_matrix_mult(A, B, ai, aj + k, bi + k, bj, (top, second, left), upper_left, cutoff, modulus)
+
+    # Upper right sub-matrix: AF + BH
+    wrapped_matrix_mult(A, B, ai, aj, bi, bj + c, (top, first, right), upper_right, cutoff, modulus)
+    wrapped_matrix_mult(A, B, ai, aj + k, bi + k, bj + c, (top, second, right), upper_right, cutoff, modulus)
+
+    # Lower left sub-matrix: CE + DG
+    wrapped_matrix_mult(A, B, ai + r, aj, bi, bj, (bottom, first, left), lower_left, cutoff, modulus)
+    wrapped_matrix_mult(A, B, ai + r, aj + k, bi + k, bj, (bottom, second, left), lower_left, cutoff, modulus)
+
+    # Lower right sub-matrix: CF + DH
+    wrapped_matrix_mult(A, B, ai + r, aj, bi, bj + c, (bottom, first, right), lower_right, cutoff, modulus)
+    wrapped_matrix_mult(A, B, ai + r, aj + k, bi + k, bj + c, (bottom, second, right), lower_right, cutoff, modulus)
 
     return product
 
-# The previous algorithm only works if n is of power of 2 (to be able to divide each n x n matrix into 4 n/2 x n/2 sub-matrices)
-# but n cannot be limited to these values.
+# The original algorithm only works if n is of power of 2 (to be able to divide each n x n matrix into 4 n/2 x n/2 sub-matrices)
+# but n cannot be limited to these values. This was handled by padding A and B with zeros up to the next power of 2, which can
+# nearly quadruple the work for n just above a power of 2 (n = 2^k + 1 is padded to 2^(k+1)).
+# Instead, since the naive algorithm never adds sub-matrices together, each size is simply split into 2 halves of sizes
+# floor(n/2) and ceil(n/2), and the quadrants do not need to have equal sizes. This also applies to rectangular matrices:
+# an m x k matrix A times a k x n matrix B splits m, k and n independently, with the shape of each block passed along the pointers.
 # Another issue is that the original matrix mult function does not have ai, aj, bi, bj among its parameters.
-# So, this is handled by placing the core algorithm in a wrapped matrix_mult function while the original call of matrix_mult handles these issues
-
-# In matrix_mult, n is checked if it is a power of 2: if log2(n) is a whole number in range 0-6,
-# since the largest input n = 100, so the last n as power of 2 in range 0-100 is 64 = n^6)
-# If condition is true call the wrapped matrix_mult function with initial values of all pointers as zeros (begining of both matrices)
-# If it is false, then the nearest power of 2 larger than n is found, and both A and B matrices are padded with zero columns and rows,
-# equal to the value of difference between this nearest power of 2 and original n
-# and the wrapped matrix_mult function is called with new zero padded A and B, and nearest power of 2 as new size
-# Then the result is sliced, to take only the original non-zero columns and rows of indices 0:n-1
-
-def matrix_mult(A, B, n):
-
-    # n is checked if it is a power of 2, with the methodolgy explained above
-    if np.log2(n) not in range(0,7):
-
-        # If n is not a power of 2, find nearest power of 2 larger than n
-        new_n = int(2 ** (np.ceil(np.log2(n))))
-        # Difference between nearest power of 2 and original n, so as to be added as number of
-        # zero columns and rows in A and B
-        extra = new_n - n
-        # Initializing 2D new_A of size nearest power of 2 value
-        new_A = np.zeros((new_n, new_n))
-        # Placing values of A in upper left part new_A, so extra rows are right, and extra columns are down
-        new_A[:-extra, :-extra] = A
-        # Same done with B as A, acquiring zero-padded new B
-        new_B = np.zeros((new_n, new_n))
-        new_B[:-extra, :-extra] = B
-        # Call wrapped matrix_mult with new zero-padded A and B, and nearest power of 2 larger than n as new_n
-        result = wrapped_matrix_mult(new_A, new_B, new_n, 0, 0, 0, 0)
-        # Slicing result to obtain only original non-zero (non-padded) columns and rows of indices 0:n-1
-        product = result[0:n, 0:n]
-
-    # If n is originally a power of 2, call wrapped matrix_mult with all initial pointer values as zeros
-    else:
-        product = wrapped_matrix_mult(A, B, n, 0, 0, 0, 0)
+# So, this is handled by placing the core algorithm in a wrapped matrix_mult function while the original call of matrix_mult
+# calls it with initial values of all pointers as zeros (begining of both matrices) and the shapes of A and B.
+# n is kept as a parameter of matrix_mult for compatibility, the sizes being taken from A and B.
 
-    return product
+def matrix_mult(A, B, n=None, cutoff=None, mode='float', modulus=None):
+
+    if A.shape[1] != B.shape[0]:
+        raise ValueError("Cannot multiply matrices of shapes {} and {}".format(A.shape, B.shape))
+
+    A, B, dtype, modulus = prepare_operands(A, B, mode, modulus, 0)
+    product = np.zeros((A.shape[0], B.shape[1]), dtype=dtype)
+    return wrapped_matrix_mult(A, B, 0, 0, 0, 0, (A.shape[0], A.shape[1], B.shape[1]), product, cutoff, modulus)
 
 
 
@@ -150,125 +263,634 @@ def matrix_mult(A, B, n):
 # RECURRANCE EQUATION: 7xT(n/2) + Kxn^2
 # TIME COMPLEXITY: Θ(n^(log2(7))) ≈ Θ(n^2.81)
 
-def wrapped_matrix_mult_fast(A, B, n):
-
-    # Base case of recursion: returning 1x1 matrix of multiplication of first (and only) elements left in A and B,
-    #                         as in each recursive step, each input matrix is sliced into 4 sub-matrices of size n//2
-    if n == 1:
-        return np.array([[A[0,0] * B[0,0]]])
-
-    # Slicing A into A_, B_, C and D, each of size n//2
-    A_ = A[0:n//2, 0:n//2]
-    B_ = A[0:n//2, n//2:n]
-    C = A[n//2:n, 0:n//2]
-    D = A[n//2:n, n//2:n]
-    # Slicing B into E, F, G and H, each of size n//2
-    E = B[0:n//2, 0:n//2]
-    F = B[0:n//2, n//2:n]
-    G = B[n//2:n, 0:n//2]
-    H = B[n//2:n, n//2:n]
-
-    # Division into 7 sub-problems/sub-matrices to be computed after slicing of A and B into 8 partitions of size n//2
-    # Each is computed according to the algebraic expression stated by Strassen
-    P1 = wrapped_matrix_mult_fast(A_, F - H, n//2)
-    P2 = wrapped_matrix_mult_fast(A_ + B_, H, n//2)
-    P3 = wrapped_matrix_mult_fast(C + D, E, n//2)
-    P4 = wrapped_matrix_mult_fast(D, G - E, n//2)
-    P5 = wrapped_matrix_mult_fast(A_ + D, E + H, n//2)
-    P6 = wrapped_matrix_mult_fast(B_ - D, G + H, n//2)
-    P7 = wrapped_matrix_mult_fast(A_ - C, E + F, n//2)
-
-    # Initializing product array to be filled with zeros
-    product = np.zeros((n, n))
-
-    # Placement of all 7 sub-matrices/sub-problems in the right places in the product matrix,
-    # with the guide of pi --> product's row pointer, pj --> product's column pointer
-    # using the correct algebraic operations of the correct sub-matrices in their right places
-
-    # Upper left sub-matrix placement: P5 + P4 - P2 + P6
-    pi = 0
-    for i in range(n//2):
-        pj = 0
-        for j in range(n//2):
-            product[pi, pj] += ( P5[i, j] + P4[i, j] - P2[i, j] + P6[i, j] )
-            pj += 1
-        pi += 1
-
-    # Upper right sub-matrix placement: P1 + P2
-    pi = 0
-    for i in range(n//2):
-        pj = n//2
-        for j in range(n//2):
-            product[pi, pj] += ( P1[i, j] + P2[i, j] )
-            pj += 1
-        pi += 1
-
-    # Lower left sub-matrix placement: P3 + P4
-    pi = n//2
-    for i in range(n//2):
-        pj = 0
-        for j in range(n//2):
-            product[pi, pj] += ( P3[i, j] + P4[i, j] )
-            pj += 1
-        pi += 1
-
-    # Lower right sub-matrix placement: P1 + P5 -P3 - P7
-    pi = n//2
-    for i in range(n//2):
-        pj = n//2
-        for j in range(n//2):
-            product[pi, pj] += ( P1[i, j] + P5[i, j] - P3[i, j] - P7[i, j] )
-            pj += 1
-        pi += 1
+# As in the naive engine, the product is written in place into a preallocated output, and below the cutoff size,
+# blocks are multiplied directly with np.dot.
+# Memory: computing the 10 sums/differences and 7 products of each level into fresh arrays creates garbage at every call.
+# Instead, each product P is computed into a scratch buffer and immediately added to (or subtracted from) the quadrants of
+# the output it belongs to, starting from a zeroed output:
+# P1 --> upper right, lower right       P2 --> -upper left, upper right       P3 --> lower left, -lower right
+# P4 --> upper left, lower left         P5 --> upper left, lower right        P6 --> upper left        P7 --> -lower right
+# So only 3 buffers of size n/2 x n/2 are needed per level (the 2 operands of P and P itself). These buffers are kept in
+# a ScratchPool indexed by recursion depth and reused by all the calls at the same depth, so the whole multiplication allocates
+# 3 x (n^2/4 + n^2/16 + ...) = n^2 elements of scratch memory once: peak memory O(n^2).
+# Odd and rectangular sizes: Strassen adds quadrants together, so they must have equal shapes, which needs even sizes.
+# An m x k matrix A times a k x n matrix B is split with each of m, k and n halved independently, as the 7 products
+# only add quadrants of A to quadrants of A, and quadrants of B to quadrants of B.
+# When a size is odd, its last row or column is peeled off (dynamic peeling), Strassen is applied to the even part,
+# and the peeled parts are fixed up with matrix-vector products (np.dot), costing O(mk + kn + mn) extra:
+# if k is odd: product[:m', :n'] += (last column of A) x (last row of B) (outer product of size m' x n')
+# if n is odd: product[:m', n-1] = A[:m', :] x (last column of B)
+# if m is odd: product[m-1, :] = (last row of A) x B
+# where m', k', n' are the even parts of m, k, n. So no padding to a power of 2 is needed for any size.
+# Winograd's variant: the same 7 products computed from 8 sums/differences of the quadrants, combined with 7 more additions
+# (15 additions per level instead of Strassen's 18), selected with variant='winograd':
+# S1 = C+D, S2 = S1-A, S3 = A-C, S4 = B-S2, T1 = F-E, T2 = H-T1, T3 = H-F, T4 = T2-G
+# M1 = AE, M2 = BG, M3 = S4H, M4 = DT4, M5 = S1T1, M6 = S2T2, M7 = S3T3
+# upper left = M1+M2, upper right = M1+M6+M5+M3, lower left = M1+M6+M7-M4, lower right = M1+M6+M7+M5
+# Crossover: below some size, np.dot (BLAS) is faster than one more level of recursion. tune_strassen_cutoff measures it on the
+# host by comparing one Strassen level against np.dot for growing sizes, and get_strassen_cutoff caches the result in a JSON file,
+# used with cutoff='auto'.
+# Instrumentation: if a hook is given, it is called once per recursive call with the depth, size, number of floating point
+# operations done at this call itself (2n^3 for np.dot blocks, one per element for each addition), and the number of arrays
+# allocated and time spent in the call, both including its sub-calls.
+
+
+# Sizes tried by tune_strassen_cutoff, and the file caching its result for this host
+TUNING_SIZES = (64, 128, 256, 512, 1024)
+STRASSEN_TUNING_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'matrix_mult_tuning.json')
+
+
+# Scratch buffers reused by all the recursive calls at the same depth
+class ScratchPool:
+
+    def __init__(self, dtype=np.float64):
+        self.dtype = dtype
+        self.buffers = {}
+        self.allocations = 0
+
+    # Returning buffers of the given shapes for the given depth, allocating them only the first time
+    def get(self, depth, shapes):
+        key = (depth, tuple(shapes))
+        if key not in self.buffers:
+            self.buffers[key] = [np.empty(shape, dtype=self.dtype) for shape in shapes]
+            self.allocations += len(shapes)
+        return self.buffers[key]
+
+
+def strassen_step(A_, B_, C, D, E, F, G, H, product, cutoff, pool, hook, depth, modulus):
+
+    r, k = A_.shape
+    c = E.shape[1]
+    S, T, P = pool.get(depth, [(r, k), (k, c), (r, c)])
+    upper_left = product[:r, :c]
+    upper_right = product[:r, c:]
+    lower_left = product[r:, :c]
+    lower_right = product[r:, c:]
+    product.fill(0)
+
+    def multiply(X, Y):
+        return wrapped_matrix_mult_fast(X, Y, P, cutoff, 'strassen', pool, hook, depth + 1, modulus)
+
+    # P1 = Ax(F-H)
+    np.subtract(F, H, out=T)
+    reduce_mod(T, modulus)
+    multiply(A_, T)
+    upper_right += P
+    lower_right += P
+    # P2 = (A+B)xH
+    np.add(A_, B_, out=S)
+    reduce_mod(S, modulus)
+    multiply(S, H)
+    upper_left -= P
+    upper_right += P
+    # P3 = (C+D)xE
+    np.add(C, D, out=S)
+    reduce_mod(S, modulus)
+    multiply(S, E)
+    lower_left += P
+    lower_right -= P
+    # P4 = Dx(G-E)
+    np.subtract(G, E, out=T)
+    reduce_mod(T, modulus)
+    multiply(D, T)
+    upper_left += P
+    lower_left += P
+    # P5 = (A+D)x(E+H)
+    np.add(A_, D, out=S)
+    np.add(E, H, out=T)
+    reduce_mod(S, modulus)
+    reduce_mod(T, modulus)
+    multiply(S, T)
+    upper_left += P
+    lower_right += P
+    # P6 = (B-D)x(G+H)
+    np.subtract(B_, D, out=S)
+    np.add(G, H, out=T)
+    reduce_mod(S, modulus)
+    reduce_mod(T, modulus)
+    multiply(S, T)
+    upper_left += P
+    # P7 = (A-C)x(E+F)
+    np.subtract(A_, C, out=S)
+    np.add(E, F, out=T)
+    reduce_mod(S, modulus)
+    reduce_mod(T, modulus)
+    multiply(S, T)
+    lower_right -= P
+    reduce_mod(product, modulus)
+
+    # 10 sums/differences of operands and 12 accumulations into the output
+    return 5 * r * k + 5 * k * c + 12 * r * c
+
+
+def winograd_step(A_, B_, C, D, E, F, G, H, product, cutoff, pool, hook, depth, modulus):
+
+    r, k = A_.shape
+    c = E.shape[1]
+    S1, S2, S3, S4, T1, T2, T3, T4, M = pool.get(depth, [(r, k)] * 4 + [(k, c)] * 4 + [(r, c)])
+    upper_left = product[:r, :c]
+    upper_right = product[:r, c:]
+    lower_left = product[r:, :c]
+    lower_right = product[r:, c:]
+
+    def multiply(X, Y):
+        return wrapped_matrix_mult_fast(X, Y, M, cutoff, 'winograd', pool, hook, depth + 1, modulus)
+
+    # 8 sums/differences of the quadrants
+    np.add(C, D, out=S1)
+    reduce_mod(S1, modulus)
+    np.subtract(S1, A_, out=S2)
+    reduce_mod(S2, modulus)
+    np.subtract(A_, C, out=S3)
+    np.subtract(B_, S2, out=S4)
+    np.subtract(F, E, out=T1)
+    reduce_mod(T1, modulus)
+    np.subtract(H, T1, out=T2)
+    reduce_mod(T2, modulus)
+    np.subtract(H, F, out=T3)
+    np.subtract(T2, G, out=T4)
+    for operand in (S3, S4, T3, T4):
+        reduce_mod(operand, modulus)
+
+    # 7 products, combined with 7 more additions as they are computed
+    multiply(A_, E)                         # M1
+    upper_left[:, :] = M
+    upper_right[:, :] = M
+    multiply(S2, T2)                        # M6
+    upper_right += M                        # M1 + M6
+    multiply(B_, G)                         # M2
+    upper_left += M                         # M1 + M2
+    multiply(S3, T3)                        # M7
+    np.add(upper_right, M, out=lower_left)  # M1 + M6 + M7
+    multiply(S1, T1)                        # M5
+    np.add(lower_left, M, out=lower_right)  # M1 + M6 + M7 + M5
+    upper_right += M                        # M1 + M6 + M5
+    multiply(S4, H)                         # M3
+    upper_right += M                        # M1 + M6 + M5 + M3
+    multiply(D, T4)                         # M4
+    lower_left -= M                         # M1 + M6 + M7 - M4
+    reduce_mod(product, modulus)
+
+    # 8 sums/differences of operands and 7 additions into the output, plus 2 copies of M1
+    return 4 * r * k + 4 * k * c + 9 * r * c
+
+
+def wrapped_matrix_mult_fast(A, B, product=None, cutoff=None, variant='strassen', pool=None, hook=None, depth=0, modulus=None):
+
+    if cutoff is None:
+        cutoff = MATRIX_MULT_CUTOFF
+    elif cutoff == 'auto':
+        cutoff = get_strassen_cutoff()
+    start = time.perf_counter() if hook is not None else None
+    m, k = A.shape
+    n = B.shape[1]
+
+    # Initializing product array and scratch pool in the first call only
+    allocations = 0
+    if product is None:
+        product = np.empty((m, n))
+        allocations += 1
+    if pool is None:
+        pool = ScratchPool(product.dtype)
+
+    # Base case of recursion: multiplying the blocks directly, reaching 1x1 blocks if cutoff = 1
+    if min(m, k, n) <= cutoff:
+        product[:, :] = block_dot(A, B, modulus)
+        flops = 2 * m * k * n
+
+    else:
+        if variant == 'strassen':
+            step = strassen_step
+        elif variant == 'winograd':
+            step = winograd_step
+        else:
+            raise ValueError("Unknown variant: {}".format(variant))
+
+        # Even parts of the sizes, and their halves
+        me, ke, ne = m - m % 2, k - k % 2, n - n % 2
+        r, h, c = me//2, ke//2, ne//2
+
+        # Slicing the even part of A into A_, B_, C and D, and the even part of B into E, F, G and H
+        A_, B_, C, D = A[:r, :h], A[:r, h:ke], A[r:me, :h], A[r:me, h:ke]
+        E, F, G, H = B[:h, :c], B[:h, c:ne], B[h:ke, :c], B[h:ke, c:ne]
+
+        allocations_before = pool.allocations
+        flops = step(A_, B_, C, D, E, F, G, H, product[:me, :ne], cutoff, pool, hook, depth, modulus)
+        allocations += pool.allocations - allocations_before
+
+        # Fixing up the peeled last column of A / row of B, last column of B, and last row of A when sizes are odd
+        if k != ke:
+            product[:me, :ne] += block_dot(A[:me, ke:], B[ke:, :ne], modulus)
+            reduce_mod(product[:me, :ne], modulus)
+            flops += 2 * me * ne
+        if n != ne:
+            product[:me, ne:] = block_dot(A[:me, :], B[:, ne:], modulus)
+            flops += 2 * me * k
+        if m != me:
+            product[me:, :] = block_dot(A[me:, :], B, modulus)
+            flops += 2 * k * n
+
+    if hook is not None:
+        hook(depth, max(m, k, n), flops, allocations, time.perf_counter() - start)
+
+    return product
+
+
+# Measuring the size from which one level of Strassen (with np.dot below it) beats np.dot on this host,
+# and returning the cutoff below which blocks should be multiplied with np.dot
+def tune_strassen_cutoff(sizes=TUNING_SIZES, repeats=3):
+
+    def best_time(function):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    for n in sizes:
+        A = np.random.rand(n, n)
+        B = np.random.rand(n, n)
+        dot_time = best_time(lambda: np.dot(A, B))
+        strassen_time = best_time(lambda: wrapped_matrix_mult_fast(A, B, cutoff=n//2))
+        if strassen_time < dot_time:
+            return n//2
+
+    # Strassen never won among the sizes tried, so np.dot is used up to the largest one
+    return sizes[-1]
+
+
+# Cutoff tuned for this host, read from the tuning file if it was measured before with the same NumPy version
+def get_strassen_cutoff(path=STRASSEN_TUNING_FILE):
+
+    host = platform.node()
+    try:
+        with open(path) as tuning_file:
+            tuning = json.load(tuning_file)
+        if tuning.get('host') == host and tuning.get('numpy') == np.__version__:
+            return tuning['strassen_cutoff']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    cutoff = tune_strassen_cutoff()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as tuning_file:
+            json.dump({'host': host, 'numpy': np.__version__, 'strassen_cutoff': cutoff}, tuning_file)
+    except OSError:
+        pass
+    return cutoff
+
+
+# Instrumentation hook collecting the calls, flops, allocations and time of each recursion depth
+class LevelStats:
+
+    def __init__(self):
+        self.levels = {}
+
+    def __call__(self, depth, n, flops, allocations, seconds):
+        level = self.levels.setdefault(depth, {'size': n, 'calls': 0, 'flops': 0, 'allocations': 0, 'seconds': 0.0})
+        level['calls'] += 1
+        level['flops'] += flops
+        level['allocations'] += allocations
+        level['seconds'] += seconds
+
+# Like the naive divide and conquer approach, the original algorithm only worked if n is of power of 2, and was called on
+# matrices zero-padded to the next power of 2. With dynamic peeling explained above, any sizes are handled directly,
+# so matrix_mult_fast only checks that the shapes of A and B can be multiplied.
+# n is kept as a parameter for compatibility, the sizes being taken from A and B.
+
+def matrix_mult_fast(A, B, n=None, cutoff=None, variant='strassen', hook=None, mode='float', modulus=None):
+
+    if A.shape[1] != B.shape[0]:
+        raise ValueError("Cannot multiply matrices of shapes {} and {}".format(A.shape, B.shape))
+    if cutoff is None:
+        cutoff = MATRIX_MULT_CUTOFF
+    elif cutoff == 'auto':
+        cutoff = get_strassen_cutoff()
+
+    A, B, dtype, modulus = prepare_operands(A, B, mode, modulus, count_levels(A.shape[0], A.shape[1], B.shape[1], cutoff))
+    product = np.empty((A.shape[0], B.shape[1]), dtype=dtype)
+    return wrapped_matrix_mult_fast(A, B, product, cutoff, variant, hook=hook, modulus=modulus)
+
+
+# Computing M^e modulo p by repeated squaring, with each multiplication done by Strassen in 'mod' mode,
+# as used for the n-th term of linear recurrences (for example, [[1, 1], [1, 0]]^n holds F(n))
+def matrix_power_mod(M, e, p, cutoff=None, variant='strassen'):
+
+    result = np.identity(M.shape[0], dtype=np.int64 if p < INT64_MODULUS_LIMIT else object) % p
+    base = np.asarray(M, dtype=result.dtype) % p
+    while e > 0:
+        if e & 1:
+            result = matrix_mult_fast(result, base, cutoff=cutoff, variant=variant, mode='mod', modulus=p)
+        base = matrix_mult_fast(base, base, cutoff=cutoff, variant=variant, mode='mod', modulus=p)
+        e >>= 1
+    return result
+
+
+
+# Parallel Execution:
+# *******************
+# The 8 block products of the naive algorithm, and the 7 products of Strassen's, are independent of each other, so the top
+# recursion levels can be dispatched to a pool of processes (ProcessPoolExecutor), each running the serial algorithm below them.
+# To avoid pickling the matrices back and forth, all operands and results are placed in one shared memory block
+# (multiprocessing.shared_memory), and each task only receives the name of the block with the offsets and shapes of its arrays,
+# which the worker process wraps as NumPy arrays without copying.
+# Naive: the product is divided into a grid of 2^levels x 2^levels blocks, and each task computes one block of the product
+#        (the sum of its block products along the inner dimension) with wrapped_matrix_mult, using the pointers of its rows of A
+#        and columns of B, so no two tasks write to the same part of the product.
+# Strassen: the operands of the 7 products (sums/differences of quadrants) are formed in the parent for the top levels
+#           (7 products for 1 level, 49 for 2 levels), computed by the workers with wrapped_matrix_mult_fast, and then combined
+#           in the parent, with the peeled rows and columns of odd sizes fixed up as in the serial version.
+# Below PARALLEL_MULT_THRESHOLD, or with a single worker, starting processes costs more than it saves, so the serial versions are used.
+
+
+# Smallest size (of m, k and n) for which multiplication is dispatched to processes
+PARALLEL_MULT_THRESHOLD = 512
+
+
+# Allocating one shared memory block holding arrays of the given shapes, returning it with the views of the arrays
+# and their offsets in bytes
+def create_shared_arrays(shapes, dtype=np.float64):
+
+    itemsize = np.dtype(dtype).itemsize
+    offsets = []
+    total = 0
+    for shape in shapes:
+        offsets.append(total)
+        total += int(np.prod(shape)) * itemsize
+    shared = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    views = [np.ndarray(shape, dtype=dtype, buffer=shared.buf, offset=offset) for shape, offset in zip(shapes, offsets)]
+    return shared, views, offsets
+
+
+# Worker task of the naive algorithm: computing the block of the product at rows [row_start, row_end) and columns [column_start, column_end)
+def multiply_shared_block(name, a_shape, b_shape, offsets, row_start, row_end, column_start, column_end, cutoff):
+
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        A = np.ndarray(a_shape, dtype=np.float64, buffer=shared.buf, offset=offsets[0])
+        B = np.ndarray(b_shape, dtype=np.float64, buffer=shared.buf, offset=offsets[1])
+        product = np.ndarray((a_shape[0], b_shape[1]), dtype=np.float64, buffer=shared.buf, offset=offsets[2])
+        block = product[row_start:row_end, column_start:column_end]
+        block.fill(0)
+        wrapped_matrix_mult(A, B, row_start, 0, 0, column_start, (row_end - row_start, a_shape[1], column_end - column_start),
+                            block, cutoff)
+        del A, B, product, block
+    finally:
+        shared.close()
+
+
+# Worker task of Strassen's algorithm: computing one product of operands X and Y into P
+def multiply_shared_pair(name, x_shape, y_shape, x_offset, y_offset, p_offset, cutoff, variant):
+
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        X = np.ndarray(x_shape, dtype=np.float64, buffer=shared.buf, offset=x_offset)
+        Y = np.ndarray(y_shape, dtype=np.float64, buffer=shared.buf, offset=y_offset)
+        P = np.ndarray((x_shape[0], y_shape[1]), dtype=np.float64, buffer=shared.buf, offset=p_offset)
+        wrapped_matrix_mult_fast(X, Y, P, cutoff, variant)
+        del X, Y, P
+    finally:
+        shared.close()
+
+
+def matrix_mult_parallel(A, B, n=None, workers=None, levels=1, cutoff=None, threshold=None):
+
+    if A.shape[1] != B.shape[0]:
+        raise ValueError("Cannot multiply matrices of shapes {} and {}".format(A.shape, B.shape))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if threshold is None:
+        threshold = PARALLEL_MULT_THRESHOLD
+    if cutoff is None:
+        cutoff = MATRIX_MULT_CUTOFF
+    m, k = A.shape
+    columns = B.shape[1]
+    if workers < 2 or min(m, k, columns) < threshold:
+        return matrix_mult(A, B, n, cutoff)
+
+    # Boundaries of the 2^levels x 2^levels grid of blocks of the product
+    parts = 2 ** levels
+    row_bounds = [m * i // parts for i in range(parts + 1)]
+    column_bounds = [columns * j // parts for j in range(parts + 1)]
+
+    shared, (shared_A, shared_B, shared_product), offsets = create_shared_arrays([(m, k), (k, columns), (m, columns)])
+    try:
+        shared_A[:, :] = A
+        shared_B[:, :] = B
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(multiply_shared_block, shared.name, (m, k), (k, columns), offsets,
+                                       row_bounds[i], row_bounds[i + 1], column_bounds[j], column_bounds[j + 1], cutoff)
+                       for i in range(parts) for j in range(parts)]
+            for future in futures:
+                future.result()
+        product = np.array(shared_product)
+    finally:
+        del shared_A, shared_B, shared_product
+        shared.close()
+        shared.unlink()
 
     return product
 
-# Like the naive divide and conquer approach, the previous algorithm only works if n is of power of 2, (to be able to divide
-# each n x n matrix into 4 n/2 x n/2 sub-matrices) but n cannot be limited to these values. However, there are no pointers to worry about here.
 
-# Again, this is handled by placing the core algorithm in a wrapped matrix_mult_fast function while the original call of matrix_mult_fast handles this issue,
-# by checking if n is a power of 2, and case it is not, nearest power of 2 larger than n is found, and a number of extra zero columns and rows, 
-# are added equal to the value of difference between it and original n --> zero padding until closest power of n is reached
-# The zero-padded sub-matrices and new_n is sent to the function, and the result is sliced to take the original non-padded columns and rows only
+# Forming the operands of the Strassen products of X and Y for the given number of levels: each product is either a leaf,
+# appended to leaves and represented by its index, or divided again, represented by its 7 children along with X and Y
+# (needed to fix up odd sizes when combining)
+def plan_strassen(X, Y, levels, cutoff, leaves):
 
-def matrix_mult_fast(A, B, n):
+    m, k = X.shape
+    n = Y.shape[1]
+    if levels == 0 or min(m, k, n) <= max(cutoff, 1):
+        leaves.append((X, Y))
+        return len(leaves) - 1
 
-    if np.log2(n) not in range(0,7):
+    me, ke, ne = m - m % 2, k - k % 2, n - n % 2
+    r, h, c = me//2, ke//2, ne//2
+    A_, B_, C, D = X[:r, :h], X[:r, h:ke], X[r:me, :h], X[r:me, h:ke]
+    E, F, G, H = Y[:h, :c], Y[:h, c:ne], Y[h:ke, :c], Y[h:ke, c:ne]
+    pairs = [(A_, F - H), (A_ + B_, H), (C + D, E), (D, G - E), (A_ + D, E + H), (B_ - D, G + H), (A_ - C, E + F)]
 
-        new_n = int(2 ** (np.ceil(np.log2(n))))
-        extra = new_n - n
-        new_A = np.zeros((new_n, new_n))
-        new_A[:-extra, :-extra] = A
-        new_B = np.zeros((new_n, new_n))
-        new_B[:-extra, :-extra] = B
-        result = wrapped_matrix_mult_fast(new_A, new_B, new_n)
-        product = result[0:n, 0:n]
+    return ([plan_strassen(left, right, levels - 1, cutoff, leaves) for left, right in pairs], X, Y)
 
-    else:
-        product = wrapped_matrix_mult_fast(A, B, n)
+
+# Combining the products computed for the leaves of a plan into the product of its X and Y
+def assemble_strassen(node, products):
+
+    if isinstance(node, int):
+        return products[node]
+
+    children, X, Y = node
+    P1, P2, P3, P4, P5, P6, P7 = [assemble_strassen(child, products) for child in children]
+    m, k = X.shape
+    n = Y.shape[1]
+    me, ke, ne = m - m % 2, k - k % 2, n - n % 2
+    r, c = me//2, ne//2
+
+    product = np.empty((m, n))
+    product[:r, :c] = P5 + P4 - P2 + P6
+    product[:r, c:ne] = P1 + P2
+    product[r:me, :c] = P3 + P4
+    product[r:me, c:ne] = P1 + P5 - P3 - P7
+
+    # Fixing up the peeled last column of X / row of Y, last column of Y, and last row of X when sizes are odd
+    if k != ke:
+        product[:me, :ne] += np.outer(X[:me, ke], Y[ke, :ne])
+    if n != ne:
+        product[:me, ne:] = np.dot(X[:me, :], Y[:, ne:])
+    if m != me:
+        product[me:, :] = np.dot(X[me:, :], Y)
 
     return product
 
 
+def matrix_mult_fast_parallel(A, B, n=None, workers=None, levels=1, cutoff=None, variant='strassen', threshold=None):
+
+    if A.shape[1] != B.shape[0]:
+        raise ValueError("Cannot multiply matrices of shapes {} and {}".format(A.shape, B.shape))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if threshold is None:
+        threshold = PARALLEL_MULT_THRESHOLD
+    if cutoff is None:
+        cutoff = MATRIX_MULT_CUTOFF
+    if workers < 2 or min(A.shape[0], A.shape[1], B.shape[1]) < threshold:
+        return matrix_mult_fast(A, B, n, cutoff, variant)
+
+    # Operands of the 7^levels products, placed with their results in one shared memory block
+    leaves = []
+    plan = plan_strassen(A, B, levels, cutoff, leaves)
+    shapes = []
+    for X, Y in leaves:
+        shapes += [X.shape, Y.shape, (X.shape[0], Y.shape[1])]
+    shared, views, offsets = create_shared_arrays(shapes)
+    try:
+        for i, (X, Y) in enumerate(leaves):
+            views[3*i][:, :] = X
+            views[3*i + 1][:, :] = Y
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(multiply_shared_pair, shared.name, X.shape, Y.shape,
+                                       offsets[3*i], offsets[3*i + 1], offsets[3*i + 2], cutoff, variant)
+                       for i, (X, Y) in enumerate(leaves)]
+            for future in futures:
+                future.result()
+        products = [np.array(views[3*i + 2]) for i in range(len(leaves))]
+    finally:
+        del views
+        shared.close()
+        shared.unlink()
+
+    return assemble_strassen(plan, products)
+
+
+
+# Out-of-Core Multiplication:
+# ***************************
+# All the versions above need A, B and the product in memory. For matrices larger than memory, A and B are read from files
+# (.npy files, or raw binary files with a given shape and dtype) opened with np.memmap, so the operating system only loads
+# the pages that are accessed, and the product is written into a memory-mapped output file in the same way.
+# The product is computed one tile at a time, as in the naive divide and conquer, but with tiles sized to a memory budget
+# instead of halves: the tile of the product at block row i and block column j is the sum over block index p of A(i, p) x B(p, j),
+# so only one tile of A, one tile of B and the accumulated tile of the product (plus a temporary product) are in memory at once,
+# and each finished tile of the product is written to the output file once.
+# Tiles are square of size t, with 5 t^2 elements fitting the budget (tiles of A and B, accumulated tile, temporary product,
+# and Strassen's scratch buffers, which add up to less than one more tile). Each tile is multiplied by np.dot,
+# or by Strassen's algorithm (matrix_mult_fast engine) with one scratch pool reused by all tiles.
+# Disk traffic: each tile of A is read n/t times and each tile of B m/t times, so larger budgets mean less reading,
+# and the product is written once. For t large enough, multiplying a tile (2t^3 operations) takes longer than reading it (t^2 elements),
+# so the multiplication runs at the speed of BLAS (or Strassen) rather than being bound by the disk.
+# COMPLEXITY: O(m x k x n) time (O(n^2.81) per tile with Strassen), O(budget) memory, O((m x k x n / t) + m x n) elements read and written
+
+
+# Memory budget (in bytes) of the tiles of out-of-core multiplication
+OUT_OF_CORE_MEMORY_BUDGET = 256 * 2**20
+
+
+# Opening a matrix file as a read-only memory map: .npy files carry their shape and dtype,
+# while raw binary files need them to be given
+def open_matrix_file(path, shape=None, dtype=np.float64):
+
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    if shape is None:
+        raise ValueError("Shape of raw matrix file {} must be given".format(path))
+    return np.memmap(path, dtype=dtype, mode='r', shape=tuple(shape))
+
+
+# Creating a matrix file of the given shape and dtype as a writable memory map, in .npy format if path ends with .npy
+def create_matrix_file(path, shape, dtype=np.float64):
+
+    if path.endswith('.npy'):
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+    return np.memmap(path, dtype=dtype, mode='w+', shape=tuple(shape))
+
+
+# Size of the square tiles such that 5 tiles of the given item size fit the memory budget
+def get_tile_size(memory_budget, itemsize):
+    return max(1, int(np.sqrt(memory_budget // (5 * itemsize))))
+
+
+# Multiplying the matrices of files a_path and b_path into file output_path, one tile at a time,
+# returning the memory map of the product
+def matrix_mult_out_of_core(a_path, b_path, output_path, memory_budget=None, a_shape=None, b_shape=None, dtype=np.float64,
+                            strassen=False, cutoff=None, variant='strassen'):
+
+    if memory_budget is None:
+        memory_budget = OUT_OF_CORE_MEMORY_BUDGET
+
+    A = open_matrix_file(a_path, a_shape, dtype)
+    B = open_matrix_file(b_path, b_shape, dtype)
+    if A.shape[1] != B.shape[0]:
+        raise ValueError("Cannot multiply matrices of shapes {} and {}".format(A.shape, B.shape))
+    m, k = A.shape
+    n = B.shape[1]
+
+    product = create_matrix_file(output_path, (m, n), dtype)
+    t = get_tile_size(memory_budget, np.dtype(dtype).itemsize)
+    tile = np.empty((min(t, m), min(t, n)), dtype=dtype)
+    partial = np.empty_like(tile)
+    pool = ScratchPool(dtype) if strassen else None
+
+    for row in range(0, m, t):
+        rows = min(t, m - row)
+        for column in range(0, n, t):
+            columns = min(t, n - column)
+            accumulated = tile[:rows, :columns]
+            accumulated.fill(0)
+            for inner in range(0, k, t):
+                # Copying the tiles out of the memory maps, so they are read from the file once per tile
+                A_tile = np.array(A[row:row + rows, inner:inner + t], dtype=dtype)
+                B_tile = np.array(B[inner:inner + t, column:column + columns], dtype=dtype)
+                if strassen:
+                    wrapped_matrix_mult_fast(A_tile, B_tile, partial[:rows, :columns], cutoff, variant, pool)
+                    accumulated += partial[:rows, :columns]
+                else:
+                    accumulated += np.dot(A_tile, B_tile)
+            product[row:row + rows, column:column + columns] = accumulated
+
+    product.flush()
+    return product
+
 
 if __name__ == '__main__':
-    n = int(input())
-    A = []
-    B = []
-    # Enter matrix 1 values, press enter after each row
+    # Out-of-core mode: python3 matrix_mult.py --out-of-core A.npy B.npy C.npy [--strassen], multiplying the files into C.npy
+    arguments = sys.argv[1:]
+    if '--out-of-core' in arguments:
+        a_path, b_path, output_path = arguments[arguments.index('--out-of-core') + 1:arguments.index('--out-of-core') + 4]
+        matrix_mult_out_of_core(a_path, b_path, output_path, strassen='--strassen' in arguments)
+        sys.exit()
+
+    data = read_ints()
+    n = int(data[0])
+    # Enter matrix 1 values, then matrix 2 values, row by row
     # Matrix 1 filling
-    for i in range(n):
-        A.append([int(j) for j in input().split()]) 
+    A = data[1:1 + n*n].reshape(n, n)
 
-    # Enter matrix 2 values, press enter after each row
     # Matrix 2 filling
-    for i in range(n):
-        B.append([int(j) for j in input().split()]) 
-
-    A = np.array(A)
-    B = np.array(B)
+    B = data[1 + n*n:1 + 2*n*n].reshape(n, n)
 
-    print(matrix_mult(A, B, n))
+    # Integer inputs are multiplied exactly, with int64 when no overflow is possible and Python integers otherwise
+    print(matrix_mult(A, B, n, mode='exact'))
 
     ''' UNCOMMENT this line if you will submit BONUS'''
-    print(matrix_mult_fast(A, B, n))
\ No newline at end of file
+    print(matrix_mult_fast(A, B, n, mode='exact'))
\ No newline at end of file
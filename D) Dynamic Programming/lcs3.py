@@ -0,0 +1,155 @@
+#Uses python3
+import os
+import sys
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints, write_ints
+from lcs2 import as_array
+
+
+# About the problem:
+# Longest Common Subsequence of 3 sequences (or more) extends lcs2 by alligning all the sequences at once.
+# The allignment matrix becomes a 3-dimensional array, where cell (i, j, k) is the maximum score of the allignment
+# of the first i letters of the 1st sequence, the first j letters of the 2nd sequence and the first k letters of the 3rd sequence.
+# 1) Diagonally ONLY if the 3 letters a[i-1], b[j-1] and c[k-1] match, with a score of 1 added to cell (i-1, j-1, k-1)
+# 2) Otherwise, the maximum of the 3 cells with one letter less in one of the sequences: (i-1, j, k), (i, j-1, k) and (i, j, k-1)
+# and the same goes for k sequences, with a k-dimensional allignment matrix.
+# COMPLEXITY: O(n x m x l) time and memory for the whole matrix
+
+# Rolling Planes:
+# Every plane i of the matrix only depends on plane i-1, so only two planes are kept and swapped, O(m x l) memory.
+# The longest sequence is chosen as the first one, so the planes span the shorter ones.
+# Vectorized Plane:
+# Within plane i, a cell is the maximum of its neighbours (j-1, k) and (j, k-1) in the same plane and of Y[j, k], where
+# Y[j, k] = plane(i-1)[j-1, k-1] + 1 on a match of the 3 letters and plane(i-1)[j, k] otherwise
+# (on a match, Y[j, k] is never below the neighbours, as removing a letter from each sequence shortens a common subsequence by
+# at most one, so taking the maximum is the same as taking Y). Unrolling this recurrence, cell (j, k) is the maximum of Y over all
+# cells (j', k') with j' <= j and k' <= k: a prefix maximum along each dimension of the plane, np.maximum.accumulate.
+# So each plane is computed with a few NumPy operations on whole planes, with no Python loop over its cells:
+# the match cells of the letter a[i-1] are the outer product of (b == a[i-1]) and (c == a[i-1]).
+# For k sequences, the planes have k - 1 dimensions and the prefix maximum is taken along each of them.
+# Process Pool:
+# The prefix maxima along the dimensions other than the first one are independent for every row of the plane,
+# so for large planes the rows are divided among worker processes (ProcessPoolExecutor), with both planes in shared memory,
+# and only the prefix maximum along the first dimension is left to the parent process.
+# COMPLEXITY: O(n x m x l) operations carried out in C, O(m x l) memory (the product of the lengths of the other sequences for k sequences)
+
+
+# Smallest number of cells of a plane for which rows are divided among processes
+PARALLEL_PLANE_THRESHOLD = 1000000
+
+
+# Cells of the plane (without its zeroth row and column) where all the other sequences hold letter, the first one limited to [start, end)
+def get_match_plane(others, letter, start, end):
+
+    dimensions = len(others)
+    matches = None
+    for axis, sequence in enumerate(others):
+        if axis == 0:
+            sequence = sequence[start:end]
+        shape = [1] * dimensions
+        shape[axis] = len(sequence)
+        equal = (sequence == letter).reshape(shape)
+        matches = equal if matches is None else matches & equal
+    return matches
+
+
+# Computing rows [start, end) of plane current from plane previous, for the letter of the first sequence,
+# up to the prefix maximum along the first dimension
+def update_plane_rows(previous, current, others, letter, start, end):
+
+    rest_inner = (slice(1, None),) * (len(others) - 1)
+    rest_before = (slice(None, -1),) * (len(others) - 1)
+    rows = current[start:end]
+    rows[...] = previous[start:end]
+    np.copyto(rows[(slice(None),) + rest_inner], previous[(slice(start - 1, end - 1),) + rest_before] + 1,
+              where=get_match_plane(others, letter, start - 1, end - 1))
+    for axis in range(1, len(others)):
+        np.maximum.accumulate(rows, axis=axis, out=rows)
+
+
+# Worker task: updating rows [start, end) of the planes in shared memory
+def update_shared_rows(name, shape, source, others, letter, start, end):
+
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        planes = np.ndarray((2,) + shape, dtype=np.int32, buffer=shared.buf)
+        update_plane_rows(planes[source], planes[1 - source], others, letter, start, end)
+        del planes
+    finally:
+        shared.close()
+
+
+# Length of the longest common subsequence of all the sequences, computed plane by plane
+def lcs_k(sequences, workers=None):
+
+    sequences = sorted((as_array(sequence) for sequence in sequences), key=len, reverse=True)
+    if len(sequences) == 0 or len(sequences[-1]) == 0:
+        return 0
+    if len(sequences) == 1:
+        return len(sequences[0])
+    first, others = sequences[0], sequences[1:]
+    shape = tuple(len(sequence) + 1 for sequence in others)
+    rows = shape[0]
+
+    if workers is None or workers < 2 or int(np.prod(shape)) < PARALLEL_PLANE_THRESHOLD:
+        previous = np.zeros(shape, dtype=np.int32)
+        current = np.zeros(shape, dtype=np.int32)
+        for letter in first.tolist():
+            update_plane_rows(previous, current, others, letter, 1, rows)
+            np.maximum.accumulate(current, axis=0, out=current)
+            previous, current = current, previous
+        return int(previous[(-1,) * len(shape)])
+
+    # Both planes in one shared memory block, with the rows of every plane divided among the workers
+    shared = shared_memory.SharedMemory(create=True, size=2 * int(np.prod(shape)) * np.dtype(np.int32).itemsize)
+    try:
+        planes = np.ndarray((2,) + shape, dtype=np.int32, buffer=shared.buf)
+        planes.fill(0)
+        bounds = [1 + (rows - 1) * w // workers for w in range(workers + 1)]
+        source = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for letter in first.tolist():
+                futures = [executor.submit(update_shared_rows, shared.name, shape, source, others, letter, bounds[w], bounds[w + 1])
+                           for w in range(workers) if bounds[w] < bounds[w + 1]]
+                for future in futures:
+                    future.result()
+                np.maximum.accumulate(planes[1 - source], axis=0, out=planes[1 - source])
+                source = 1 - source
+        result = int(planes[source][(-1,) * len(shape)])
+        del planes
+    finally:
+        shared.close()
+        shared.unlink()
+
+    return result
+
+
+def lcs3(a, b, c, workers=None):
+    return lcs_k([a, b, c], workers)
+
+
+if __name__ == '__main__':
+    data = read_ints().tolist()
+
+    n = data[0]
+    data = data[1:]
+    a = data[:n]
+
+    data = data[n:]
+    m = data[0]
+    data = data[1:]
+    b = data[:m]
+
+    data = data[m:]
+    l = data[0]
+    data = data[1:]
+    c = data[:l]
+
+    write_ints([lcs3(a, b, c)])
@@ -1,6 +1,13 @@
 # Uses python3
+import os
 import sys
 
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints, write_ints
+
 
 
 # To build the binary search tree data structure, two classes are defined: BinaryTreeNode, specifying the properties of a binary tree
@@ -167,11 +174,9 @@ class BinarySearchTree:
 
 if __name__ == '__main__':
 
-    input = sys.stdin.read()
-    data = list(map(int, input.split()))
+    data = read_ints().tolist()
 
     tree = BinarySearchTree()
     tree.InsertManyNodes(data)
 
-    print(tree.FindMinimumIteratively())
-    print(tree.FindMinimumRecursively(tree.GetRoot()))
+    write_ints([tree.FindMinimumIteratively(), tree.FindMinimumRecursively(tree.GetRoot())], sep='\n')
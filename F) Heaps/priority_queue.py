@@ -0,0 +1,241 @@
+# python3
+import os
+import sys
+import operator
+import numpy as np
+
+# fast_io is in the repository root
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repository_root not in sys.path:
+    sys.path.insert(0, repository_root)
+from fast_io import read_ints, write_ints
+
+
+# build_heap turns a static array into a heap, but a priority queue must also keep the heap property while elements are added,
+# removed and have their priorities changed. PriorityQueue keeps the same array layout as build_heap, generalized to d children
+# per node: for a zero-indexed array, the children of node i are at indices d x i + 1 ... d x i + d, and its parent is at (i - 1) // d.
+# A 4-ary heap is half as deep as a binary heap, and the d children of a node are next to each other in memory,
+# so sifting down touches fewer levels at the cost of more comparisons per level.
+
+# Each entry is an item with a priority (the item itself, key(item) if a key function is given, or a priority passed explicitly).
+# Priorities and items are kept in two parallel arrays, along with a position map (dictionary) from each item to its index,
+# updated whenever an entry moves, so an item can be found in O(1) to change its priority or remove it.
+# Items must therefore be hashable and unique in the queue. Priorities can be stored in a NumPy array for numeric keys.
+# Both sift_up and sift_down are iterative and hole-based as explained in build_heap file: the moved entry is kept aside,
+# the entries on its path are shifted into the hole one by one, and the entry is written once into the final hole.
+# A max heap is obtained by comparing priorities with > instead of <.
+
+# COMPLEXITY:
+# push, update (sifting up): O(log_d(n))
+# pop, replace, remove, update (sifting down): O(d x log_d(n))
+# peek: O(1), heapify: O(n), merge: O(n + m) for a queue of m entries
+
+# Compared with heapq (implemented in C, without a position map): pushing then popping 2 x 10^5 random floats takes about 12x
+# the time of heapq with a 4-ary PriorityQueue and about 20x with a binary one, as every move pays Python-level indexing and
+# a position map update. So heapq remains the choice when priorities never change, and PriorityQueue is meant for
+# decrease-key and removal by item (such as Dijkstra's or Prim's algorithms), where heapq needs lazy deletion instead.
+# NumPy storage saves memory for numeric priorities, but reading NumPy scalars one by one is slower than reading list elements.
+
+
+class PriorityQueue:
+
+    __slots__ = ('priorities', 'items', 'positions', 'size', 'arity', 'key', 'before', 'numpy_storage')
+
+    def __init__(self, items=(), key=None, max_heap=False, arity=2, numpy_storage=False, dtype=np.float64):
+        # Class Attributes: priorities and items arrays, position map of items, number of entries, number of children per node,
+        # key function computing the priority of an item, comparison deciding which of two priorities comes first,
+        # and whether the priorities are stored in a NumPy array
+        if arity < 2:
+            raise ValueError("Arity of the heap must be at least 2")
+        self.arity = arity
+        self.key = key
+        self.before = operator.gt if max_heap else operator.lt
+        self.numpy_storage = numpy_storage
+        self.priorities = np.zeros(16, dtype=dtype) if numpy_storage else []
+        self.items = []
+        self.positions = {}
+        self.size = 0
+        self.heapify(items)
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def get_priority(self, item, priority):
+        if priority is not None:
+            return priority
+        return self.key(item) if self.key is not None else item
+
+    # Appending an empty slot at the end of the arrays, growing the NumPy array by doubling when full
+    def append_slot(self):
+        if self.numpy_storage:
+            if self.size == len(self.priorities):
+                self.priorities = np.concatenate((self.priorities, np.zeros_like(self.priorities)))
+        else:
+            self.priorities.append(None)
+        self.items.append(None)
+        self.size += 1
+
+    # Removing the last slot of the arrays, returning its entry
+    def pop_slot(self):
+        self.size -= 1
+        priority = self.priorities[self.size] if self.numpy_storage else self.priorities.pop()
+        item = self.items.pop()
+        return priority, item
+
+    # Moving entry (priority, item) up from the hole at index i, while it comes before its parent
+    # (the arrays and the comparison are bound to local names, as this loop runs for every push)
+    def sift_up(self, i, priority, item):
+        priorities, items, positions = self.priorities, self.items, self.positions
+        before = self.before
+        arity = self.arity
+        while i > 0:
+            parent = (i - 1) // arity
+            parent_priority = priorities[parent]
+            if not before(priority, parent_priority):
+                break
+            parent_item = items[parent]
+            priorities[i] = parent_priority
+            items[i] = parent_item
+            positions[parent_item] = i
+            i = parent
+        priorities[i] = priority
+        items[i] = item
+        positions[item] = i
+
+    # Moving entry (priority, item) down from the hole at index i, while one of its children comes before it
+    def sift_down(self, i, priority, item):
+        priorities, items, positions = self.priorities, self.items, self.positions
+        before = self.before
+        arity = self.arity
+        size = self.size
+        while True:
+            # Finding the child coming first among the (up to) d children of the hole
+            best = arity * i + 1
+            if best >= size:
+                break
+            best_priority = priorities[best]
+            for child in range(best + 1, min(best + arity, size)):
+                if before(priorities[child], best_priority):
+                    best = child
+                    best_priority = priorities[child]
+            if not before(best_priority, priority):
+                break
+            best_item = items[best]
+            priorities[i] = best_priority
+            items[i] = best_item
+            positions[best_item] = i
+            i = best
+        priorities[i] = priority
+        items[i] = item
+        positions[item] = i
+
+    # Bulk insertion of items, rebuilding the heap in O(n) as in build_heap, from the last internal node up to the root
+    def heapify(self, items):
+        for item in items:
+            if item in self.positions:
+                raise ValueError("Item is already in the queue: {!r}".format(item))
+            self.append_slot()
+            self.priorities[self.size - 1] = self.get_priority(item, None)
+            self.items[self.size - 1] = item
+            self.positions[item] = self.size - 1
+        self.rebuild()
+
+    # Sifting down every internal node, from the last one up to the root
+    def rebuild(self):
+        for i in range((self.size - 2) // self.arity, -1, -1):
+            self.sift_down(i, self.priorities[i], self.items[i])
+
+    # Moving all the entries of another queue into this one, keeping their priorities, and rebuilding the heap in O(n + m)
+    # (the other queue is left unchanged, and nothing is added if one of its items is already in this queue)
+    def merge(self, other):
+        for i in range(other.size):
+            if other.items[i] in self.positions:
+                raise ValueError("Item is already in the queue: {!r}".format(other.items[i]))
+        for i in range(other.size):
+            self.append_slot()
+            self.priorities[self.size - 1] = other.priorities[i]
+            self.items[self.size - 1] = other.items[i]
+            self.positions[other.items[i]] = self.size - 1
+        self.rebuild()
+
+    def push(self, item, priority=None):
+        if item in self.positions:
+            raise ValueError("Item is already in the queue: {!r}".format(item))
+        self.append_slot()
+        self.sift_up(self.size - 1, self.get_priority(item, priority), item)
+
+    # Item coming first, without removing it
+    def peek(self):
+        if self.size == 0:
+            raise IndexError("peek from an empty priority queue")
+        return self.items[0]
+
+    # Priority of item, in O(1) through the position map
+    def priority_of(self, item):
+        return self.priorities[self.positions[item]]
+
+    # Removing and returning the item coming first: the last entry fills the root and is sifted down
+    def pop(self):
+        if self.size == 0:
+            raise IndexError("pop from an empty priority queue")
+        top = self.items[0]
+        del self.positions[top]
+        priority, item = self.pop_slot()
+        if self.size > 0:
+            self.sift_down(0, priority, item)
+        return top
+
+    # Popping then pushing in one sift down: the new entry takes the place of the root
+    def replace(self, item, priority=None):
+        if self.size == 0:
+            raise IndexError("replace on an empty priority queue")
+        if item in self.positions and self.positions[item] != 0:
+            raise ValueError("Item is already in the queue: {!r}".format(item))
+        top = self.items[0]
+        del self.positions[top]
+        self.sift_down(0, self.get_priority(item, priority), item)
+        return top
+
+    # Pushing then popping: if the new entry would come first, it is returned right away without touching the heap
+    def pushpop(self, item, priority=None):
+        priority = self.get_priority(item, priority)
+        if self.size == 0 or not self.before(self.priorities[0], priority):
+            return item
+        return self.replace(item, priority)
+
+    # Changing the priority of an item already in the queue, sifting it up or down accordingly
+    def update(self, item, priority):
+        i = self.positions[item]
+        if self.before(priority, self.priorities[i]):
+            self.sift_up(i, priority, item)
+        else:
+            self.sift_down(i, priority, item)
+
+    # Moving an item closer to the root only (smaller priority in a min heap, greater in a max heap)
+    def decrease_key(self, item, priority):
+        if self.before(self.priorities[self.positions[item]], priority):
+            raise ValueError("New priority would move the item away from the root")
+        self.sift_up(self.positions[item], priority, item)
+
+    # Removing any item: the last entry fills its place and is sifted up or down
+    def remove(self, item):
+        i = self.positions.pop(item)
+        priority, last = self.pop_slot()
+        if i < self.size:
+            if self.before(priority, self.priorities[i]):
+                self.sift_up(i, priority, last)
+            else:
+                self.sift_down(i, priority, last)
+
+
+if __name__ == '__main__':
+    # Sorting the input (n followed by n integers) by pushing all of them and popping them in order
+    n, *a = read_ints().tolist()
+    queue = PriorityQueue(range(n), key=a.__getitem__, arity=4)
+    write_ints([a[queue.pop()] for _ in range(n)])